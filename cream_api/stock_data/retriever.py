@@ -140,12 +140,31 @@ class StockDataRetriever:
             "Maximum retries exceeded", f"Failed to retrieve data after {self.config.max_retries} attempts"
         )
 
-    async def _fetch_page(self, symbol: str, end_timestamp: int) -> str:
+    def create_session(self) -> aiohttp.ClientSession:
+        """Create an HTTP session configured for Yahoo Finance requests.
+
+        The caller owns the session and must close it, typically with ``async with``.
+        Passing one session to several retrievals reuses its connection pool.
+
+        Returns:
+            aiohttp ClientSession with the configured timeout and headers
+        """
+        timeout = aiohttp.ClientTimeout(total=self.config.timeout)
+        return aiohttp.ClientSession(
+            timeout=timeout,
+            headers=self.headers,
+            skip_auto_headers=["Accept-Encoding"],
+            max_line_size=MAX_HEADER_SIZE,
+            max_field_size=MAX_HEADER_SIZE,
+        )
+
+    async def _fetch_page(self, symbol: str, end_timestamp: int, session: aiohttp.ClientSession | None = None) -> str:
         """Fetch historical stock data page from Yahoo Finance.
 
         Args:
             symbol: Stock symbol to fetch data for
             end_timestamp: Unix timestamp for the end date
+            session: Shared session to use (defaults to a new session for this request)
 
         Returns:
             Raw HTML content of the historical data page
@@ -156,27 +175,24 @@ class StockDataRetriever:
         url = f"{BASE_URL}/quote/{symbol}/history/?period1=0&period2={end_timestamp}"
         logger.info("Fetching historical data for %s up to %d", symbol, end_timestamp)
 
-        timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-        session = aiohttp.ClientSession(
-            timeout=timeout,
-            headers=self.headers,
-            skip_auto_headers=["Accept-Encoding"],
-            max_line_size=MAX_HEADER_SIZE,
-            max_field_size=MAX_HEADER_SIZE,
-        )
-        async with session:
+        if session is not None:
             return await self._make_request(session, url)
 
+        async with self.create_session() as own_session:
+            return await self._make_request(own_session, url)
+
     async def get_historical_data(
         self,
         symbol: str,
         end_date: str | None = None,
+        session: aiohttp.ClientSession | None = None,
     ) -> None:
         """Get and save historical stock data for a symbol.
 
         Args:
             symbol: Stock symbol to fetch data for
             end_date: End date in 'YYYY-MM-DD' format (defaults to today)
+            session: Shared session to use (defaults to a new session for this request)
 
         Raises:
             StockRetrievalError: If the request fails after all retries
@@ -191,6 +207,6 @@ class StockDataRetriever:
         except ValueError as e:
             raise ValueError(f"Invalid date format: {end_date}. Expected YYYY-MM-DD") from e
 
-        html_content = await self._fetch_page(symbol, end_timestamp)
+        html_content = await self._fetch_page(symbol, end_timestamp, session)
         self.save_html(symbol, html_content)
         logger.info("Successfully retrieved historical data for %s", symbol)
@@ -1,11 +1,16 @@
 """Tests for stock data retriever."""
 
+import os
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
 import pytest
 import pytest_asyncio
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from cream_api.stock_data.config import StockDataConfig
 from cream_api.stock_data.retriever import StockDataRetriever
+from cream_api.tests.stock_data.stock_data_test_constants import DEFAULT_TEST_SYMBOL, TEST_DATE
 
 
 @pytest.fixture
@@ -54,3 +59,44 @@ async def session(async_test_db: AsyncSession) -> AsyncSession:
 async def retriever(test_config: StockDataConfig) -> StockDataRetriever:
     """Create a stock data retriever instance with test configuration."""
     return StockDataRetriever(config=test_config)
+
+
+@pytest.mark.asyncio
+async def test_create_session_uses_config(retriever: StockDataRetriever, test_config: StockDataConfig) -> None:
+    """Test that created sessions carry the configured timeout and headers."""
+    async with retriever.create_session() as http_session:
+        assert http_session.timeout.total == test_config.timeout
+        assert http_session.headers["User-Agent"] == test_config.user_agent
+
+
+@pytest.mark.asyncio
+async def test_get_historical_data_uses_passed_session(
+    retriever: StockDataRetriever, test_config: StockDataConfig, sample_html: str
+) -> None:
+    """Test that a passed-in session is used for every request and left open."""
+    end_date = TEST_DATE.strftime("%Y-%m-%d")
+    symbols = [DEFAULT_TEST_SYMBOL, "MSFT"]
+    async with retriever.create_session() as http_session:
+        with patch.object(retriever, "_make_request", AsyncMock(return_value=sample_html)) as mock_request:
+            for symbol in symbols:
+                await retriever.get_historical_data(symbol, end_date, session=http_session)
+
+        assert [call.args[0] for call in mock_request.await_args_list] == [http_session] * len(symbols)
+        assert not http_session.closed
+
+    assert len(os.listdir(test_config.raw_responses_dir)) == len(symbols)
+
+
+@pytest.mark.asyncio
+async def test_get_historical_data_without_session_closes_own_session(
+    retriever: StockDataRetriever, sample_html: str
+) -> None:
+    """Test that the no-session path opens a session for the request and closes it afterwards."""
+    end_date = TEST_DATE.strftime("%Y-%m-%d")
+    with patch.object(retriever, "_make_request", AsyncMock(return_value=sample_html)) as mock_request:
+        await retriever.get_historical_data(DEFAULT_TEST_SYMBOL, end_date)
+
+    mock_request.assert_awaited_once()
+    own_session = mock_request.await_args_list[0].args[0]
+    assert isinstance(own_session, aiohttp.ClientSession)
+    assert own_session.closed
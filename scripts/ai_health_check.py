@@ -18,18 +18,21 @@ SPDX-License-Identifier: [MIT](https://spdx.org/licenses/MIT.html)
 """
 
 # Standard library imports
-import functools
-import json
 import os
+import re
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
 # Local imports
-# (None for this script)
+from output_helper import json_dumps, json_loads
 
 # Module-level constants
 DEFAULT_VERBOSE = False
+MAX_READ_WORKERS = 8
+IGNORED_REFERENCE_PATTERN = re.compile(r"^https?://|(?i:example|placeholder)")
 
 # Module-level variables
 # (None for this script)
@@ -54,6 +57,12 @@ class AIDocumentationHealthCheck:
         self.success_count = 0
         self.issues: list[str] = []
         self.warnings: list[str] = []
+        self.parsed_files: dict[str, Any] = {}
+        self.ai_files: set[str] = set()
+        self.ai_directories: set[str] = set()
+        self.project_root = os.path.abspath(os.path.join(self.ai_folder, ".."))
+        self._reference_cache: dict[str, bool] = {}
+        self._project_file_index: set[str] | None = None
 
     def run_health_check(self) -> bool:
         """Run the complete health check.
@@ -64,6 +73,9 @@ class AIDocumentationHealthCheck:
         if self.verbose:
             print("🔍 Starting AI documentation health check...")
 
+        # Parse every JSON file once for all checks
+        self._load_all_json()
+
         # Check core structure
         self._check_core_structure()
 
@@ -90,13 +102,11 @@ class AIDocumentationHealthCheck:
         if self.verbose:
             if self.issues:
                 print("\n❌ Issues:")
-                for issue in self.issues:
-                    print(f"  - {issue}")
+                print("\n".join(f"  - {issue}" for issue in self.issues))
 
             if self.warnings:
                 print("\n⚠️ Warnings:")
-                for warning in self.warnings:
-                    print(f"  - {warning}")
+                print("\n".join(f"  - {warning}" for warning in self.warnings))
 
         if len(self.issues) == 0:
             print("\n✅ Health check completed successfully!")
@@ -113,8 +123,7 @@ class AIDocumentationHealthCheck:
         required_files = ["ai_rules.json", "search_index.json", "ai_config.json"]
 
         for file_name in required_files:
-            file_path = os.path.join(self.ai_folder, file_name)
-            if os.path.exists(file_path):
+            if file_name in self.ai_files:
                 self.success_count += 1
             else:
                 self.issues.append(f"Missing required file: {file_name}")
@@ -122,8 +131,7 @@ class AIDocumentationHealthCheck:
         required_dirs = ["guide_docs", "project_context", "outputs"]
 
         for dir_name in required_dirs:
-            dir_path = os.path.join(self.ai_folder, dir_name)
-            if os.path.exists(dir_path) and os.path.isdir(dir_path):
+            if dir_name in self.ai_directories:
                 self.success_count += 1
             else:
                 self.issues.append(f"Missing required directory: {dir_name}")
@@ -133,15 +141,13 @@ class AIDocumentationHealthCheck:
         if self.verbose:
             print("📋 Checking consolidated rules...")
 
-        rules_file = os.path.join(self.ai_folder, "ai_rules.json")
-        if not os.path.exists(rules_file):
-            self.issues.append("Missing ai_rules.json")
+        data = self.parsed_files.get("ai_rules.json")
+        if data is None:
+            if "ai_rules.json" not in self.ai_files:
+                self.issues.append("Missing ai_rules.json")
             return
 
         try:
-            with open(rules_file, encoding="utf-8") as f:
-                data = json.load(f)
-
             # Check for required sections
             required_sections = ["core_principles", "mandatory_workflows", "documentation_structure"]
             for section in required_sections:
@@ -163,35 +169,91 @@ class AIDocumentationHealthCheck:
         except Exception as e:
             self.issues.append(f"Error reading consolidated rules: {e}")
 
-    def _check_json_files(self) -> None:
-        """Check that all JSON files have proper structure."""
-        if self.verbose:
-            print("📄 Checking JSON file structure...")
+    def _iter_json_files(self, directory: str | None = None) -> Iterator[str]:
+        """Yield every JSON file under the AI folder, excluding generated outputs.
 
-        json_files = []
-        for root, _dirs, files in os.walk(self.ai_folder):
-            for file in files:
-                if file.endswith(".json"):
-                    json_files.append(os.path.join(root, file))
+        Walks the tree with ``os.scandir`` so entry types come from the cached
+        ``DirEntry`` data, and prunes ``outputs`` directories without descending
+        into them. Every file and directory seen is recorded in ``ai_files`` and
+        ``ai_directories`` (relative to the AI folder) so structure checks can
+        use set lookups instead of further ``stat`` calls.
 
-        for json_file in json_files:
-            if "outputs" in json_file:
-                continue
+        Args:
+            directory: Directory to scan (defaults to the AI folder).
 
-            relative_path = os.path.relpath(json_file, self.ai_folder)
+        Yields:
+            Paths to the JSON documentation files.
+        """
+        try:
+            entries = os.scandir(directory or self.ai_folder)
+        except OSError:
+            return
 
-            try:
-                with open(json_file, encoding="utf-8") as f:
-                    data = json.load(f)
+        subdirectories = []
+        with entries:
+            for entry in entries:
+                relative_path = os.path.relpath(entry.path, self.ai_folder)
+                if entry.is_dir():
+                    self.ai_directories.add(relative_path)
+                    if entry.name != "outputs" and not entry.is_symlink():
+                        subdirectories.append(entry.path)
+                elif entry.is_file():
+                    self.ai_files.add(relative_path)
+                    if entry.name.endswith(".json"):
+                        yield entry.path
+
+        for subdirectory in subdirectories:
+            yield from self._iter_json_files(subdirectory)
+
+    def _load_all_json(self) -> None:
+        """Load and parse every JSON documentation file once.
+
+        Parsed data is stored in ``parsed_files`` keyed by the path relative to
+        the AI folder, so each check reuses it instead of re-reading the file.
+        Files that fail to parse are reported once and left out of the cache.
+
+        Reads are issued from a thread pool so file I/O overlaps; results are
+        collected in discovery order to keep the report deterministic.
+        """
+        json_files = list(self._iter_json_files())
+        if not json_files:
+            return
 
-                if self._has_proper_structure(data):
-                    self.success_count += 1
-                else:
-                    self.warnings.append(f"Improper structure in {relative_path}")
+        with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(json_files))) as executor:
+            futures = [executor.submit(self._read_json, json_file) for json_file in json_files]
+
+        for json_file, future in zip(json_files, futures, strict=True):
+            relative_path = os.path.relpath(json_file, self.ai_folder)
 
+            try:
+                self.parsed_files[relative_path] = future.result()
             except Exception as e:
                 self.issues.append(f"Error reading {relative_path}: {e}")
 
+    @staticmethod
+    def _read_json(json_file: str) -> Any:
+        """Read and parse a single JSON file.
+
+        Args:
+            json_file: Path to the JSON file.
+
+        Returns:
+            The parsed JSON data.
+        """
+        with open(json_file, "rb") as f:
+            return json_loads(f.read())
+
+    def _check_json_files(self) -> None:
+        """Check that all JSON files have proper structure."""
+        if self.verbose:
+            print("📄 Checking JSON file structure...")
+
+        for relative_path, data in self.parsed_files.items():
+            if self._has_proper_structure(data):
+                self.success_count += 1
+            else:
+                self.warnings.append(f"Improper structure in {relative_path}")
+
     def _has_proper_structure(self, data: dict[str, Any]) -> bool:
         """Check if a JSON file has proper AI documentation structure.
 
@@ -220,23 +282,10 @@ class AIDocumentationHealthCheck:
         if self.verbose:
             print("🔗 Checking cross-references...")
 
-        json_files = []
-        for root, _dirs, files in os.walk(self.ai_folder):
-            for file in files:
-                if file.endswith(".json"):
-                    json_files.append(os.path.join(root, file))
-
-        for json_file in json_files:
-            if "outputs" in json_file:
-                continue
-
-            relative_path = os.path.relpath(json_file, self.ai_folder)
-
+        for relative_path, data in self.parsed_files.items():
             try:
-                with open(json_file, encoding="utf-8") as f:
-                    data = json.load(f)
-
                 # Check cross-references in metadata
+                json_file = os.path.join(self.ai_folder, relative_path)
                 self._check_file_cross_references(data, json_file)
 
             except Exception as e:
@@ -251,23 +300,19 @@ class AIDocumentationHealthCheck:
         """
         # Check metadata cross-references
         metadata = data.get("metadata", {})
-        cross_refs = metadata.get("cross_references", [])
+        cross_refs = [ref for ref in metadata.get("cross_references", []) if not self._should_ignore_reference(ref)]
 
         for ref in cross_refs:
-            if self._should_ignore_reference(ref):
-                continue
-
             if not self._reference_exists(ref):
                 self.warnings.append(f"Cross-reference to non-existent file: {ref} in {file_path}")
 
         # Check AI metadata cross-references
         ai_metadata = data.get("ai_metadata", {})
-        ai_cross_refs = ai_metadata.get("cross_references", [])
+        ai_cross_refs = [
+            ref for ref in ai_metadata.get("cross_references", []) if not self._should_ignore_reference(ref)
+        ]
 
         for ref in ai_cross_refs:
-            if self._should_ignore_reference(ref):
-                continue
-
             if not self._reference_exists(ref):
                 self.warnings.append(f"AI metadata cross-reference to non-existent file: {ref} in {file_path}")
 
@@ -280,20 +325,30 @@ class AIDocumentationHealthCheck:
         Returns:
             True if the reference should be ignored, False otherwise.
         """
-        # Ignore external URLs
-        if ref.startswith(("http://", "https://")):
-            return True
+        # Ignore external URLs and example placeholders
+        return IGNORED_REFERENCE_PATTERN.search(ref) is not None
 
-        # Ignore example placeholders
-        if "example" in ref.lower() or "placeholder" in ref.lower():
-            return True
+    def _reference_exists(self, ref: str) -> bool:
+        """Check if a referenced file or directory exists.
 
-        return False
+        Results are cached per normalized reference (so ``./docs/a.md`` and
+        ``docs/a.md`` share an entry), and the fallback filename search uses a
+        project-wide index built once instead of walking the tree per lookup.
 
-    @staticmethod
-    @functools.lru_cache(maxsize=256)
-    def _reference_exists(ref: str) -> bool:
-        """Check if a referenced file or directory exists using os.path.
+        Args:
+            ref: The reference string to check.
+
+        Returns:
+            True if the referenced file or directory exists, False otherwise.
+        """
+        # Keep the trailing slash so directory and file references stay distinct
+        cache_key = os.path.normpath(ref) + ("/" if ref.endswith("/") else "")
+        if cache_key not in self._reference_cache:
+            self._reference_cache[cache_key] = self._resolve_reference(ref)
+        return self._reference_cache[cache_key]
+
+    def _resolve_reference(self, ref: str) -> bool:
+        """Resolve a reference against the filesystem and project file index.
 
         Args:
             ref: The reference string to check.
@@ -301,7 +356,7 @@ class AIDocumentationHealthCheck:
         Returns:
             True if the referenced file or directory exists, False otherwise.
         """
-        project_root = os.path.abspath(os.path.join("ai", ".."))
+        project_root = self.project_root
 
         # Handle directory references (ending with /)
         if ref.endswith("/"):
@@ -311,7 +366,7 @@ class AIDocumentationHealthCheck:
                 resolved_dir = os.path.normpath(dir_name)
             else:
                 resolved_dir = os.path.normpath(os.path.join(project_root, dir_name))
-            return os.path.exists(resolved_dir) and os.path.isdir(resolved_dir)
+            return os.path.isdir(resolved_dir)
 
         # Handle file references
         filename = os.path.basename(ref)
@@ -323,36 +378,46 @@ class AIDocumentationHealthCheck:
         else:
             resolved_path = os.path.normpath(os.path.join(project_root, ref))
 
-        if os.path.exists(resolved_path) and os.path.isfile(resolved_path):
+        if os.path.isfile(resolved_path):
             return True
 
         # If that fails, search for the file by name in the project
-        for _, _, files in os.walk(project_root):
-            if filename in files or base_name in files:
-                return True
-        return False
+        file_index = self._get_project_file_index()
+        return filename in file_index or base_name in file_index
+
+    def _get_project_file_index(self) -> set[str]:
+        """Get the names of all files in the project, building the index on first use.
+
+        Returns:
+            The set of file names found anywhere under the project root.
+        """
+        if self._project_file_index is None:
+            file_index: set[str] = set()
+            pending = [self.project_root]
+            while pending:
+                try:
+                    entries = os.scandir(pending.pop())
+                except OSError:
+                    # Skip unreadable directories, as os.walk does
+                    continue
+
+                with entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            if not entry.is_symlink():
+                                pending.append(entry.path)
+                        else:
+                            file_index.add(entry.name)
+            self._project_file_index = file_index
+        return self._project_file_index
 
     def _check_metadata_consistency(self) -> None:
         """Check that metadata is consistent across files."""
         if self.verbose:
             print("📊 Checking metadata consistency...")
 
-        json_files = []
-        for root, _dirs, files in os.walk(self.ai_folder):
-            for file in files:
-                if file.endswith(".json"):
-                    json_files.append(os.path.join(root, file))
-
-        for json_file in json_files:
-            if "outputs" in json_file:
-                continue
-
-            relative_path = os.path.relpath(json_file, self.ai_folder)
-
+        for relative_path, data in self.parsed_files.items():
             try:
-                with open(json_file, encoding="utf-8") as f:
-                    data = json.load(f)
-
                 # Check that files have proper metadata
                 if "metadata" in data:
                     metadata = data["metadata"]
@@ -379,8 +444,8 @@ class AIDocumentationHealthCheck:
         # Save JSON report
         json_report = self._generate_json_report()
         json_file = os.path.join(outputs_dir, "healthcheck-result.json")
-        with open(json_file, "w", encoding="utf-8") as f:
-            json.dump(json_report, f, indent=2)
+        with open(json_file, "wb") as f:
+            f.write(json_dumps(json_report))
 
         if self.verbose:
             print(f"📄 JSON results saved to: {json_file}")
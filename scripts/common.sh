@@ -112,8 +112,12 @@ generate_ai_report() {
     # Generate deterministic report filename (no timestamp)
     local report_file="$ai_output_dir/${report_type}-results.json"
 
+    # Build the report in a sibling temp file and move it into place once complete,
+    # so readers never see a partial or half-edited report
+    local temp_file="$report_file.$$.tmp"
+
     # Create JSON report
-    cat > "$report_file" << EOF
+    cat > "$temp_file" << EOF
 {
   "ai_metadata": {
     "purpose": "${report_type} results for AI consumption",
@@ -164,16 +168,18 @@ EOF
     # Add additional content if provided
     if [[ -n "$additional_content" ]]; then
         # Insert additional content before the closing brace using a different delimiter
-        sed -i "s|  \"cross_references\": \[\],|  \"cross_references\": \[\],\n$additional_content|" "$report_file"
+        sed -i "s|  \"cross_references\": \[\],|  \"cross_references\": \[\],\n$additional_content|" "$temp_file"
     fi
 
     # Update file size and line count
-    local file_size=$(wc -c < "$report_file")
-    local line_count=$(wc -l < "$report_file")
+    local file_size=$(wc -c < "$temp_file")
+    local line_count=$(wc -l < "$temp_file")
 
     # Update the JSON with actual values
-    sed -i "s/\"file_size\": 0/\"file_size\": $file_size/" "$report_file"
-    sed -i "s/\"line_count\": 0/\"line_count\": $line_count/" "$report_file"
+    sed -i "s/\"file_size\": 0/\"file_size\": $file_size/" "$temp_file"
+    sed -i "s/\"line_count\": 0/\"line_count\": $line_count/" "$temp_file"
+
+    mv -f "$temp_file" "$report_file"
 
     print_status "Generated AI ${report_type} report: $report_file"
 }
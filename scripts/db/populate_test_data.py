@@ -23,11 +23,13 @@ import argparse
 import asyncio
 import logging
 import os
-import subprocess
 import sys
+import uuid
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+import numpy as np
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from cream_api.settings import get_app_settings
@@ -40,6 +42,39 @@ project_root = os.path.dirname(os.path.dirname(script_dir))  # Go up 2 levels to
 # Module-level constants
 DEFAULT_RECORD_COUNT = 10
 STOCK_SYMBOLS = ["TEST", "DEMO", "SAMPLE", "FAKE", "MOCK", "DUMMY", "EXAMPLE", "TRIAL", "PILOT", "PROTO"]
+DEFAULT_BASE_PRICE = 100.0
+DEFAULT_BASE_VOLUME = 20000000
+
+# Column order used when bulk loading stock data with COPY
+STOCK_DATA_COLUMNS = ("symbol", "date", "open", "high", "low", "close", "adj_close", "volume")
+
+# Base prices for fictional stocks (realistic but fake)
+STOCK_BASE_PRICES = {
+    "TEST": 180.0,
+    "DEMO": 140.0,
+    "SAMPLE": 380.0,
+    "FAKE": 150.0,
+    "MOCK": 250.0,
+    "DUMMY": 480.0,
+    "EXAMPLE": 900.0,
+    "TRIAL": 600.0,
+    "PILOT": 150.0,
+    "PROTO": 45.0,
+}
+
+# Realistic volume based on stock popularity (fictional)
+STOCK_BASE_VOLUMES = {
+    "TEST": 50000000,
+    "DEMO": 30000000,
+    "SAMPLE": 25000000,
+    "FAKE": 40000000,
+    "MOCK": 80000000,
+    "DUMMY": 20000000,
+    "EXAMPLE": 35000000,
+    "TRIAL": 15000000,
+    "PILOT": 45000000,
+    "PROTO": 35000000,
+}
 
 # Module-level variables
 logger = logging.getLogger(__name__)
@@ -47,8 +82,8 @@ logger = logging.getLogger(__name__)
 settings = get_app_settings()
 
 
-def run_command(command: list[str], cwd: str | None = None) -> bool:
-    """Run a shell command and return success status.
+async def run_command(command: list[str], cwd: str | None = None) -> bool:
+    """Run a shell command without blocking the event loop and return success status.
 
     Args:
         command: List of command arguments
@@ -57,17 +92,21 @@ def run_command(command: list[str], cwd: str | None = None) -> bool:
     Returns:
         bool: True if command succeeded, False otherwise
     """
-    try:
-        subprocess.run(command, cwd=cwd, check=True, capture_output=True, text=True)
+    process = await asyncio.create_subprocess_exec(
+        *command, cwd=cwd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    _, stderr = await process.communicate()
+
+    if process.returncode == 0:
         logger.info(f"Command succeeded: {' '.join(command)}")
         return True
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Command failed: {' '.join(command)}")
-        logger.error(f"Error: {e.stderr}")
-        return False
+
+    logger.error(f"Command failed: {' '.join(command)}")
+    logger.error(f"Error: {stderr.decode(errors='replace')}")
+    return False
 
 
-def drop_database() -> bool:
+async def drop_database() -> bool:
     """Drop the development database.
 
     Returns:
@@ -78,10 +117,10 @@ def drop_database() -> bool:
     # Connect as postgres user to drop database
     drop_command = ["sudo", "-u", "postgres", "psql", "-c", f"DROP DATABASE IF EXISTS {settings.db_name};"]
 
-    return run_command(drop_command, cwd=None)
+    return await run_command(drop_command, cwd=None)
 
 
-def create_database() -> bool:
+async def create_database() -> bool:
     """Create the development database.
 
     Returns:
@@ -99,10 +138,10 @@ def create_database() -> bool:
         f"CREATE DATABASE {settings.db_name} OWNER {settings.db_user};",
     ]
 
-    return run_command(create_command, cwd=None)
+    return await run_command(create_command, cwd=None)
 
 
-def apply_migrations() -> bool:
+async def apply_migrations() -> bool:
     """Apply all database migrations.
 
     Returns:
@@ -115,10 +154,10 @@ def apply_migrations() -> bool:
     # Run alembic upgrade
     migrate_command = ["poetry", "run", "alembic", "upgrade", "head"]
 
-    return run_command(migrate_command, cwd=api_dir)
+    return await run_command(migrate_command, cwd=api_dir)
 
 
-def grant_table_permissions() -> bool:
+async def grant_table_permissions() -> bool:
     """Grant necessary database permissions.
 
     Returns:
@@ -129,72 +168,88 @@ def grant_table_permissions() -> bool:
     # Run the grant permissions script with sudo (requires root privileges)
     grant_command = ["sudo", "bash", os.path.join(project_root, "scripts", "db", "grant_table_permissions.sh")]
 
-    return run_command(grant_command, cwd=None)
+    return await run_command(grant_command, cwd=None)
 
 
-def generate_stock_data(symbol: str, date: datetime) -> dict[str, Any]:
+def generate_stock_data(symbols: list[str], dates: list[datetime]) -> list[dict[str, Any]]:
     """Generate realistic stock data for browsing the website.
 
+    Prices and volumes for every symbol and date are computed as NumPy arrays
+    in one pass rather than per record.
+
     Args:
-        symbol: Stock symbol (e.g., "TEST")
-        date: Date for the stock data
+        symbols: Stock symbols (e.g., ["TEST", "DEMO"])
+        dates: Dates to generate stock data for
 
     Returns:
-        dict: Dictionary containing stock data fields
+        list: One dictionary of stock data fields per symbol and date
     """
-    # Base prices for fictional stocks (realistic but fake)
-    base_prices = {
-        "TEST": 180.0,
-        "DEMO": 140.0,
-        "SAMPLE": 380.0,
-        "FAKE": 150.0,
-        "MOCK": 250.0,
-        "DUMMY": 480.0,
-        "EXAMPLE": 900.0,
-        "TRIAL": 600.0,
-        "PILOT": 150.0,
-        "PROTO": 45.0,
-    }
-
-    base_price = base_prices.get(symbol, 100.0)
+    # Symbols along the rows, dates along the columns
+    base_prices = [STOCK_BASE_PRICES.get(symbol, DEFAULT_BASE_PRICE) for symbol in symbols]
+    base_volumes = [STOCK_BASE_VOLUMES.get(symbol, DEFAULT_BASE_VOLUME) for symbol in symbols]
+    base_price = np.array(base_prices)[:, np.newaxis]
+    base_volume = np.array(base_volumes, dtype=np.int64)[:, np.newaxis]
+    day_of_year = np.array([date.timetuple().tm_yday for date in dates])
 
     # Add some realistic daily variation based on the date
-    day_of_year = date.timetuple().tm_yday
     variation = (day_of_year % 20 - 10) / 100  # ±10% variation
 
     open_price = base_price * (1 + variation)
     high_price = open_price * 1.03  # 3% daily high
     low_price = open_price * 0.97  # 3% daily low
     close_price = open_price * (1 + (day_of_year % 7 - 3) / 100)  # Small close variation
-    adj_close = close_price
-
-    # Realistic volume based on stock popularity (fictional)
-    base_volumes = {
-        "TEST": 50000000,
-        "DEMO": 30000000,
-        "SAMPLE": 25000000,
-        "FAKE": 40000000,
-        "MOCK": 80000000,
-        "DUMMY": 20000000,
-        "EXAMPLE": 35000000,
-        "TRIAL": 15000000,
-        "PILOT": 45000000,
-        "PROTO": 35000000,
-    }
-
-    volume = base_volumes.get(symbol, 20000000)
-    volume += (day_of_year % 10) * 1000000  # Add some daily variation
-
-    return {
-        "symbol": symbol,
-        "date": date,
-        "open": round(open_price, 2),
-        "high": round(high_price, 2),
-        "low": round(low_price, 2),
-        "close": round(close_price, 2),
-        "adj_close": round(adj_close, 2),
-        "volume": volume,
-    }
+    volume = base_volume + (day_of_year % 10) * 1000000  # Add some daily variation
+
+    # Python's round() is used when flattening since np.round() differs on exact half-cent values
+    rows = zip(
+        symbols,
+        open_price.tolist(),
+        high_price.tolist(),
+        low_price.tolist(),
+        close_price.tolist(),
+        volume.tolist(),
+        strict=True,
+    )
+    return [
+        {
+            "symbol": symbol,
+            "date": date,
+            "open": round(open_, 2),
+            "high": round(high, 2),
+            "low": round(low, 2),
+            "close": round(close, 2),
+            "adj_close": round(close, 2),
+            "volume": day_volume,
+        }
+        for symbol, opens, highs, lows, closes, volumes in rows
+        for date, open_, high, low, close, day_volume in zip(dates, opens, highs, lows, closes, volumes, strict=True)
+    ]
+
+
+async def bulk_insert_stock_data(session: AsyncSession, stock_records: list[dict[str, Any]]) -> None:
+    """Bulk load stock records in the session's transaction.
+
+    On PostgreSQL the rows are streamed with COPY FROM STDIN through the psycopg
+    driver connection; other dialects fall back to a single bulk INSERT.
+
+    Args:
+        session: Session whose transaction the rows are loaded in
+        stock_records: Stock data fields per symbol and date
+    """
+    connection = await session.connection()
+    if connection.dialect.name != "postgresql":
+        await session.execute(insert(StockData), stock_records)
+        return
+
+    raw_connection = await connection.get_raw_connection()
+    driver_connection = raw_connection.driver_connection
+    if driver_connection is None:
+        raise RuntimeError("No psycopg driver connection available for COPY")
+
+    copy_sql = f"COPY {StockData.__tablename__} (id, {', '.join(STOCK_DATA_COLUMNS)}) FROM STDIN"
+    async with driver_connection.cursor() as cursor, cursor.copy(copy_sql) as copy:
+        for record in stock_records:
+            await copy.write_row((uuid.uuid4(), *(record[column] for column in STOCK_DATA_COLUMNS)))
 
 
 async def populate_stock_data(record_count: int) -> None:
@@ -216,28 +271,27 @@ async def populate_stock_data(record_count: int) -> None:
         async with async_session() as session:
             # Create tracked stocks
             logger.info("Creating tracked stocks...")
-            tracked_stocks = []
-            for i, symbol in enumerate(STOCK_SYMBOLS[:record_count]):
-                tracked_stock = TrackedStock(
+            symbols = STOCK_SYMBOLS[:record_count]
+            now = datetime.now(UTC)
+            session.add_all(
+                TrackedStock(
                     symbol=symbol,
-                    last_pull_date=datetime.now(UTC) - timedelta(hours=i + 1),
+                    last_pull_date=now - timedelta(hours=i + 1),
                     last_pull_status="success",
                     error_message=None,
                     is_active=False,
                 )
-                session.add(tracked_stock)
-                tracked_stocks.append(tracked_stock)
+                for i, symbol in enumerate(symbols)
+            )
             await session.commit()
 
-            # Create stock data
+            # Create 30 days of historical data per symbol as one bulk load
             logger.info("Creating stock data...")
-            for tracked_stock in tracked_stocks:
-                # Create 30 days of historical data
-                for days_ago in range(30):
-                    date = datetime.now(UTC) - timedelta(days=days_ago)
-                    stock_data = generate_stock_data(tracked_stock.symbol, date)
-                    stock_record = StockData(**stock_data)
-                    session.add(stock_record)
+            # The date column is a naive DateTime; COPY would drop a UTC offset, so pass naive UTC values
+            utc_now = now.replace(tzinfo=None)
+            dates = [utc_now - timedelta(days=days_ago) for days_ago in range(30)]
+            stock_records = generate_stock_data(symbols, dates)
+            await bulk_insert_stock_data(session, stock_records)
             await session.commit()
 
             logger.info("Stock data population completed successfully!")
@@ -307,22 +361,22 @@ Examples:
         start_time = datetime.now()
 
         # Step 1: Drop database
-        if not drop_database():
+        if not await drop_database():
             logger.error("Failed to drop database")
             sys.exit(1)
 
         # Step 2: Create database
-        if not create_database():
+        if not await create_database():
             logger.error("Failed to create database")
             sys.exit(1)
 
         # Step 3: Apply migrations
-        if not apply_migrations():
+        if not await apply_migrations():
             logger.error("Failed to apply migrations")
             sys.exit(1)
 
         # Step 4: Grant table permissions
-        if not grant_table_permissions():
+        if not await grant_table_permissions():
             logger.error("Failed to grant table permissions")
             sys.exit(1)
 
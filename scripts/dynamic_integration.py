@@ -16,22 +16,139 @@ SPDX-License-Identifier: [MIT](https://spdx.org/licenses/MIT.html)
 """
 
 # Standard library imports
-import json
+import functools
 import os
+import re
 import sys
-from datetime import datetime
-from typing import Any
+from collections import defaultdict
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from types import MappingProxyType
+from typing import Any, Final
 
 # Local imports
-# (None for this module)
+from output_helper import json_loads, write_json_atomic
 
 # Module-level constants
 DEFAULT_VERBOSE = False
+JSON_CACHE_SIZE = 64
+MAX_READ_WORKERS = 8
+VERSION_PATTERN = re.compile(r"^(\d+)\.(\d+)")
+
+# Guide names mapped to their paths relative to the ai folder
+GUIDE_MAPPING: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "python_style_guide": "guide_docs/language_specific/python_style_guide.json",
+        "fastapi_development_guide": "guide_docs/language_specific/fastapi_development_guide.json",
+        "database_management_guide": "guide_docs/domain_specific/database_management_guide.json",
+        "shell_style_guide": "guide_docs/domain_specific/shell_style_guide.json",
+    }
+)
+
+# Pattern names mapped to the category they are grouped under
+CATEGORY_MAPPING: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "module_documentation": "documentation_patterns",
+        "import_organization": "code_organization",
+        "type_hints": "code_quality",
+        "error_handling": "error_handling",
+        "file_operations": "file_operations",
+        "logging_setup": "logging_patterns",
+        "database_patterns": "database_patterns",
+        "fastapi_patterns": "api_patterns",
+        "testing_patterns": "testing_patterns",
+        "security_patterns": "security_patterns",
+    }
+)
+
+# Pattern categories mapped to their section name in core principles
+SECTION_MAPPING: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "documentation_patterns": "documentation_patterns",
+        "code_organization": "code_organization_patterns",
+        "code_quality": "code_quality_patterns",
+        "error_handling": "error_handling_patterns",
+        "file_operations": "file_operations_patterns",
+        "logging_patterns": "logging_patterns",
+        "database_patterns": "database_patterns",
+        "api_patterns": "api_patterns",
+        "testing_patterns": "testing_patterns",
+        "security_patterns": "security_patterns",
+    }
+)
+
+# Guides whose patterns win a category conflict, highest priority first
+PRIORITY_ORDER: Final[tuple[str, ...]] = (
+    "python_style_guide",
+    "fastapi_development_guide",
+    "database_management_guide",
+)
+PRIORITY_RANK: Final[Mapping[str, int]] = MappingProxyType(
+    {guide_name: rank for rank, guide_name in enumerate(PRIORITY_ORDER)}
+)
 
 # Module-level variables
 # (None for this module)
 
 
+@functools.lru_cache(maxsize=JSON_CACHE_SIZE)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file, memoized on its path and stat signature.
+
+    The modification time and size are part of the cache key so an edited
+    file is re-read instead of served stale. Callers must not mutate the
+    returned data.
+
+    Args:
+        path: Path to the JSON file.
+        mtime_ns: Modification time of the file in nanoseconds.
+        size: Size of the file in bytes.
+
+    Returns:
+        The parsed JSON data.
+    """
+    with open(path, "rb") as f:
+        return json_loads(f.read())
+
+
+def _load_json(path: str) -> Any:
+    """Load a JSON file through the stat-keyed cache.
+
+    Args:
+        path: Path to the JSON file.
+
+    Returns:
+        The parsed JSON data.
+    """
+    st = os.stat(path)
+    return _load_json_cached(path, st.st_mtime_ns, st.st_size)
+
+
+def _discard_log(message: str) -> None:
+    """Drop a progress line; used as the logger when not running verbosely.
+
+    Args:
+        message: The line that would have been printed.
+    """
+
+
+@dataclass(slots=True)
+class PatternRecord:
+    """A validated pattern competing for a category during conflict resolution.
+
+    Attributes:
+        guide: Name of the guide the pattern came from.
+        name: Name of the pattern.
+        data: The pattern data.
+    """
+
+    guide: str
+    name: str
+    data: Any
+
+
 class DynamicIntegration:
     """Dynamic integration system for AI documentation patterns.
 
@@ -48,14 +165,30 @@ class DynamicIntegration:
         self.script_dir = os.path.dirname(__file__)
         self.project_root = os.path.dirname(self.script_dir)
         self.ai_folder = os.path.join(self.project_root, "ai")
+        self.config_path = os.path.join(self.ai_folder, "ai_config.json")
+        self.core_principles_path = os.path.join(self.ai_folder, "guide_docs", "core_principles.json")
+        self.output_dir = os.path.join(self.ai_folder, "outputs", "dynamic_integration")
+        self.report_path = os.path.join(self.output_dir, "integration-report.json")
+        self.guide_paths = {
+            guide_name: os.path.join(self.ai_folder, guide_file) for guide_name, guide_file in GUIDE_MAPPING.items()
+        }
 
         self.changes_made: list[str] = []
         self.conflicts_resolved: list[str] = []
         self.errors: list[str] = []
         self.verbose = verbose
 
+        # Verbose progress lines are queued and written out once per phase; quiet runs drop them
+        self._log_buf: list[str] = []
+        self._log: Callable[[str], None] = self._log_buf.append if verbose else _discard_log
+
+        # Timestamp stamped on everything a run writes; refreshed per run
+        self._run_timestamp = datetime.now(UTC).isoformat()
+
         # Load integration configuration
         self.integration_rules = self._load_config()
+        self._enabled = bool((self.integration_rules.get("dynamic_integration") or {}).get("enabled"))
+        self._critical_patterns = self._normalize_critical_patterns()
 
     def _load_config(self) -> dict[str, Any]:
         """Load the AI configuration file.
@@ -63,15 +196,45 @@ class DynamicIntegration:
         Returns:
             The configuration data dictionary.
         """
-        config_path = os.path.join(self.ai_folder, "ai_config.json")
         try:
-            with open(config_path, encoding="utf-8") as f:
-                data: dict[str, Any] = json.load(f)
-                return data
+            data: dict[str, Any] = _load_json(self.config_path)
+            return data
         except Exception as e:
             print(f"Error loading config: {e}")
             return {}
 
+    def _normalize_critical_patterns(self) -> dict[str, tuple[str, ...]]:
+        """Lowercase and intern each guide's critical patterns once.
+
+        Section content is matched in lowercase, so the pattern names are
+        normalized here rather than on every scan. The loaded configuration is
+        shared through the load cache and is left untouched. Malformed rules are
+        recorded as extraction errors and the guide is skipped.
+
+        Returns:
+            Dictionary mapping each guide name to its normalized critical patterns.
+        """
+        pattern_extraction = self.integration_rules.get("pattern_extraction")
+        extraction_rules = pattern_extraction.get("extraction_rules") if isinstance(pattern_extraction, dict) else None
+        if not isinstance(extraction_rules, dict):
+            return {}
+
+        critical_patterns: dict[str, tuple[str, ...]] = {}
+        for guide_name, rules in extraction_rules.items():
+            patterns = rules.get("critical_patterns", []) if isinstance(rules, dict) else None
+            if not isinstance(patterns, list) or not all(isinstance(pattern, str) for pattern in patterns):
+                self.errors.append(f"Error extracting from {guide_name}: critical_patterns must be a list of strings")
+                self._log(f"❌ Error extracting from {guide_name}: critical_patterns must be a list of strings")
+                continue
+            critical_patterns[guide_name] = tuple(sys.intern(pattern.lower()) for pattern in patterns)
+        return critical_patterns
+
+    def _flush_log(self) -> None:
+        """Write all queued progress lines to stdout in a single call."""
+        if self._log_buf:
+            sys.stdout.write("\n".join(self._log_buf) + "\n")
+            self._log_buf.clear()
+
     def run_integration(self, trigger: str = "manual_request") -> bool:
         """Run the complete dynamic integration process.
 
@@ -81,71 +244,137 @@ class DynamicIntegration:
         Returns:
             True if integration was successful, False otherwise.
         """
-        if self.verbose:
-            print(f"🔄 Running Dynamic Integration (trigger: {trigger})...")
-            print()
+        self._log(f"🔄 Running Dynamic Integration (trigger: {trigger})...")
+        self._log("")
 
-        if not self.integration_rules.get("dynamic_integration", {}).get("enabled", False):
-            if self.verbose:
-                print("❌ Dynamic integration is disabled in config")
+        if not self._enabled:
+            self._log("❌ Dynamic integration is disabled in config")
+            self._flush_log()
             return False
 
+        if self._is_up_to_date():
+            self._log("ℹ️  No source changes since the last integration")
+            self._flush_log()
+            return True
+
+        self._run_timestamp = datetime.now(UTC).isoformat()
+
         try:
             # Extract patterns from source guides
             extracted_patterns = self._extract_patterns_from_guides()
+            self._flush_log()
 
             # Validate extracted patterns
             validated_patterns = self._validate_patterns(extracted_patterns)
+            self._flush_log()
 
             # Resolve conflicts
             resolved_patterns = self._resolve_conflicts(validated_patterns)
+            self._flush_log()
 
             # Update core principles
             success = self._update_core_principles(resolved_patterns)
+            self._flush_log()
 
             # Generate integration report
             self._generate_integration_report(trigger)
+            self._flush_log()
 
             return success
 
         except Exception as e:
             self.errors.append(f"Integration failed: {e}")
+            self._flush_log()
             print(f"❌ Integration failed: {e}")
             return False
 
+    def _is_up_to_date(self) -> bool:
+        """Check whether the inputs are unchanged since the last completed integration.
+
+        The previous report is written after core principles, so if it is newer
+        than the configuration, core principles and every guide, rerunning the
+        pipeline would not change anything. Only file modification times are
+        compared; nothing is parsed apart from the small previous report.
+
+        Returns:
+            True if the last integration completed and no input changed since.
+        """
+        try:
+            report_mtime = os.stat(self.report_path).st_mtime_ns
+            previous_report = _load_json(self.report_path)
+        except (OSError, ValueError):
+            return False
+
+        if not self._is_completed_report(previous_report):
+            return False
+
+        input_paths = [self.config_path, self.core_principles_path, *self.guide_paths.values()]
+        for input_path in input_paths:
+            try:
+                if os.stat(input_path).st_mtime_ns >= report_mtime:
+                    return False
+            except FileNotFoundError:
+                continue
+
+        return True
+
     def _extract_patterns_from_guides(self) -> dict[str, Any]:
         """Extract patterns from source guides based on integration rules.
 
         Returns:
             Dictionary of extracted patterns organized by guide name.
         """
-        if self.verbose:
-            print("📖 Extracting patterns from source guides...")
+        self._log("📖 Extracting patterns from source guides...")
 
         extracted_patterns: dict[str, Any] = {}
-        extraction_rules = self.integration_rules.get("pattern_extraction", {}).get("extraction_rules", {})
-
-        for guide_name, rules in extraction_rules.items():
-            guide_path = self._get_guide_path(guide_name)
-            if not guide_path or not os.path.exists(guide_path):
-                if self.verbose:
-                    print(f"⚠️  Guide not found: {guide_name}")
-                continue
-
+        if not self._critical_patterns:
+            return extracted_patterns
+
+        # Guides are loaded and scanned concurrently; results are collected in
+        # rule order so the output and error list stay deterministic
+        with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(self._critical_patterns))) as executor:
+            futures = [
+                executor.submit(self._extract_patterns_from_guide_file, guide_name, critical_patterns)
+                for guide_name, critical_patterns in self._critical_patterns.items()
+            ]
+
+        for guide_name, future in zip(self._critical_patterns, futures, strict=True):
             try:
-                guide_data = self._load_guide(guide_path)
-                patterns = self._extract_patterns_from_guide(guide_data, rules)
-                extracted_patterns[guide_name] = patterns
-                if self.verbose:
-                    print(f"✅ Extracted patterns from: {guide_name}")
+                extracted_patterns[guide_name] = future.result()
+                self._log(f"✅ Extracted patterns from: {guide_name}")
+
+            except FileNotFoundError:
+                self._log(f"⚠️  Guide not found: {guide_name}")
 
             except Exception as e:
                 self.errors.append(f"Error extracting from {guide_name}: {e}")
-                if self.verbose:
-                    print(f"❌ Error extracting from {guide_name}: {e}")
+                self._log(f"❌ Error extracting from {guide_name}: {e}")
 
         return extracted_patterns
 
+    def _extract_patterns_from_guide_file(self, guide_name: str, critical_patterns: tuple[str, ...]) -> dict[str, Any]:
+        """Load one guide and extract its patterns.
+
+        This only reads shared state, so it is safe to run from worker threads.
+        A missing guide surfaces as FileNotFoundError from the load itself, so
+        existence is not checked separately beforehand.
+
+        Args:
+            guide_name: Name of the guide to extract from.
+            critical_patterns: Normalized names of the patterns to extract.
+
+        Returns:
+            Dictionary of extracted patterns.
+
+        Raises:
+            FileNotFoundError: If the guide is unknown or its file does not exist.
+        """
+        guide_path = self._get_guide_path(guide_name)
+        if not guide_path:
+            raise FileNotFoundError(guide_name)
+        guide_data = self._load_guide(guide_path)
+        return self._extract_patterns_from_guide(guide_data, critical_patterns)
+
     def _get_guide_path(self, guide_name: str) -> str | None:
         """Get the file path for a guide based on its name.
 
@@ -155,82 +384,87 @@ class DynamicIntegration:
         Returns:
             Full path to the guide file, or None if not found.
         """
-        guide_mapping = {
-            "python_style_guide": "guide_docs/language_specific/python_style_guide.json",
-            "fastapi_development_guide": "guide_docs/language_specific/fastapi_development_guide.json",
-            "database_management_guide": "guide_docs/domain_specific/database_management_guide.json",
-            "shell_style_guide": "guide_docs/domain_specific/shell_style_guide.json",
-        }
-
-        relative_path = guide_mapping.get(guide_name)
-        if relative_path:
-            return os.path.join(self.ai_folder, relative_path)
-        return None
+        return self.guide_paths.get(guide_name)
 
     def _load_guide(self, guide_path: str) -> dict[str, Any]:
         """Load a guide file and return its content.
 
+        Guides are served from a cache keyed on their modification time and
+        size, so repeated runs only re-parse guides that changed.
+
         Args:
             guide_path: Path to the guide file.
 
         Returns:
             The guide data dictionary.
         """
-        with open(guide_path, encoding="utf-8") as f:
-            data: dict[str, Any] = json.load(f)
-            return data
+        data: dict[str, Any] = _load_json(guide_path)
+        return data
 
-    def _extract_patterns_from_guide(self, guide_data: dict[str, Any], rules: dict[str, Any]) -> dict[str, Any]:
-        """Extract specific patterns from a guide based on extraction rules.
+    def _extract_patterns_from_guide(
+        self, guide_data: dict[str, Any], critical_patterns: tuple[str, ...]
+    ) -> dict[str, Any]:
+        """Extract specific patterns from a guide.
 
         Args:
             guide_data: The guide data to extract patterns from.
-            rules: The extraction rules to apply.
+            critical_patterns: Normalized names of the patterns to extract.
 
         Returns:
-            Dictionary of extracted patterns.
+            Dictionary of extracted patterns, in the order of the critical patterns.
         """
-        patterns: dict[str, Any] = {}
-        critical_patterns = rules.get("critical_patterns", [])
         sections = guide_data.get("sections", {})
 
-        for pattern_name in critical_patterns:
-            # Look for pattern in sections
-            pattern_content = self._find_pattern_in_sections(sections, pattern_name)
-            if pattern_content:
-                patterns[pattern_name] = pattern_content
+        found = self._find_patterns_in_sections(sections, critical_patterns)
+        return {pattern_name: found[pattern_name] for pattern_name in critical_patterns if pattern_name in found}
 
-        return patterns
+    def _find_patterns_in_sections(self, sections: dict[str, Any], pattern_names: tuple[str, ...]) -> dict[str, Any]:
+        """Find several patterns within guide sections in a single sweep.
 
-    def _find_pattern_in_sections(self, sections: dict[str, Any], pattern_name: str) -> dict[str, Any] | None:
-        """Find a specific pattern within guide sections.
+        A pattern named after a section resolves to that section directly. The
+        remaining patterns are matched against the content of each section,
+        which is lowercased once per section, and each pattern takes the first
+        section that mentions it.
 
         Args:
             sections: The sections to search in.
-            pattern_name: Name of the pattern to find.
+            pattern_names: Names of the patterns to find.
 
         Returns:
-            The pattern data if found, None otherwise.
+            Dictionary mapping each pattern that was found to its data.
         """
+        found: dict[str, Any] = {}
+        pending: list[str] = []
+
         # Direct section match
-        if pattern_name in sections:
-            section_data = sections[pattern_name]
-            if isinstance(section_data, dict):
-                return section_data
-            return None
+        for pattern_name in pattern_names:
+            if pattern_name not in sections:
+                pending.append(pattern_name)
+            elif isinstance(sections[pattern_name], dict) and sections[pattern_name]:
+                found[pattern_name] = sections[pattern_name]
 
         # Search within section content
         for section_name, section_data in sections.items():
-            if isinstance(section_data, dict):
-                # Check if this section contains the pattern
-                if pattern_name in section_data.get("content", "").lower():
-                    return {
+            if not pending:
+                break
+            if not isinstance(section_data, dict):
+                continue
+
+            content = section_data.get("content", "")
+            content_lower = content.lower()
+            unmatched: list[str] = []
+            for pattern_name in pending:
+                if pattern_name in content_lower:
+                    found[pattern_name] = {
                         "section": section_name,
-                        "content": section_data.get("content", ""),
+                        "content": content,
                         "description": section_data.get("description", ""),
                     }
+                else:
+                    unmatched.append(pattern_name)
+            pending = unmatched
 
-        return None
+        return found
 
     def _validate_patterns(self, extracted_patterns: dict[str, Any]) -> dict[str, Any]:
         """Validate extracted patterns for consistency and completeness.
@@ -241,8 +475,7 @@ class DynamicIntegration:
         Returns:
             Dictionary of validated patterns.
         """
-        if self.verbose:
-            print("🔍 Validating extracted patterns...")
+        self._log("🔍 Validating extracted patterns...")
 
         validated_patterns: dict[str, Any] = {}
 
@@ -252,10 +485,9 @@ class DynamicIntegration:
             for pattern_name, pattern_data in patterns.items():
                 if self._validate_single_pattern(pattern_name, pattern_data):
                     validated_patterns[guide_name][pattern_name] = pattern_data
-                    if self.verbose:
-                        print(f"✅ Validated: {guide_name}.{pattern_name}")
-                elif self.verbose:
-                    print(f"⚠️  Invalid pattern: {guide_name}.{pattern_name}")
+                    self._log(f"✅ Validated: {guide_name}.{pattern_name}")
+                else:
+                    self._log(f"⚠️  Invalid pattern: {guide_name}.{pattern_name}")
 
         return validated_patterns
 
@@ -289,20 +521,17 @@ class DynamicIntegration:
         Returns:
             Dictionary of resolved patterns.
         """
-        if self.verbose:
-            print("⚖️  Resolving pattern conflicts...")
+        self._log("⚖️  Resolving pattern conflicts...")
 
         resolved_patterns: dict[str, Any] = {}
         conflicts: list[str] = []
 
         # Group patterns by category
-        pattern_categories: dict[str, list[dict[str, Any]]] = {}
+        pattern_categories: defaultdict[str, list[PatternRecord]] = defaultdict(list)
         for guide_name, patterns in validated_patterns.items():
             for pattern_name, pattern_data in patterns.items():
                 category = self._categorize_pattern(pattern_name)
-                if category not in pattern_categories:
-                    pattern_categories[category] = []
-                pattern_categories[category].append({"guide": guide_name, "name": pattern_name, "data": pattern_data})
+                pattern_categories[category].append(PatternRecord(guide_name, pattern_name, pattern_data))
 
         # Resolve conflicts within each category
         for category, patterns in pattern_categories.items():
@@ -314,59 +543,35 @@ class DynamicIntegration:
                     conflicts.append(f"Resolved conflict in {category}")
             else:
                 # Single pattern - no conflict
-                resolved_patterns[category] = patterns[0]["data"]
+                resolved_patterns[category] = patterns[0].data
 
         self.conflicts_resolved.extend(conflicts)
         return resolved_patterns
 
     def _categorize_pattern(self, pattern_name: str) -> str:
         """Categorize a pattern based on its name."""
-        category_mapping = {
-            "module_documentation": "documentation_patterns",
-            "import_organization": "code_organization",
-            "type_hints": "code_quality",
-            "error_handling": "error_handling",
-            "file_operations": "file_operations",
-            "logging_setup": "logging_patterns",
-            "database_patterns": "database_patterns",
-            "fastapi_patterns": "api_patterns",
-            "testing_patterns": "testing_patterns",
-            "security_patterns": "security_patterns",
-        }
-
-        return category_mapping.get(pattern_name, "general_patterns")
+        return CATEGORY_MAPPING.get(pattern_name, "general_patterns")
 
-    def _resolve_category_conflict(self, category: str, patterns: list[dict[str, Any]]) -> dict[str, Any] | None:
+    def _resolve_category_conflict(self, category: str, patterns: list[PatternRecord]) -> dict[str, Any] | None:
         """Resolve conflicts within a pattern category."""
-        # Priority-based resolution
-        priority_order = ["python_style_guide", "fastapi_development_guide", "database_management_guide"]
-
-        for priority_guide in priority_order:
-            for pattern in patterns:
-                if pattern["guide"] == priority_guide:
-                    pattern_data = pattern["data"]
-                    if isinstance(pattern_data, dict):
-                        return pattern_data
-                    return None
-
-        # If no priority match, use the first one
-        if patterns:
-            pattern_data = patterns[0]["data"]
-            if isinstance(pattern_data, dict):
-                return pattern_data
+        if not patterns:
+            return None
+
+        # Priority-based resolution; unranked guides tie, so the first one wins
+        winner = min(patterns, key=lambda pattern: PRIORITY_RANK.get(pattern.guide, len(PRIORITY_RANK)))
+        pattern_data = winner.data
+        if isinstance(pattern_data, dict):
+            return pattern_data
         return None
 
     def _update_core_principles(self, resolved_patterns: dict[str, Any]) -> bool:
         """Update core principles with resolved patterns."""
-        if self.verbose:
-            print("📝 Updating core principles...")
-
-        core_principles_path = os.path.join(self.ai_folder, "guide_docs", "core_principles.json")
+        self._log("📝 Updating core principles...")
 
         try:
             # Load current core principles
-            with open(core_principles_path, encoding="utf-8") as f:
-                core_data: dict[str, Any] = json.load(f)
+            with open(self.core_principles_path, "rb") as f:
+                core_data: dict[str, Any] = json_loads(f.read())
 
             # Update sections with new patterns
             sections = core_data.get("sections", {})
@@ -380,52 +585,34 @@ class DynamicIntegration:
                         "description": f"Dynamically integrated patterns for {category}",
                         "content": self._format_pattern_content(pattern_data),
                         "source": "dynamic_integration",
-                        "last_updated": datetime.now().isoformat(),
+                        "last_updated": self._run_timestamp,
                     }
                     updated = True
                     self.changes_made.append(f"Added section: {section_name}")
-                    if self.verbose:
-                        print(f"✅ Added section: {section_name}")
+                    self._log(f"✅ Added section: {section_name}")
 
             # Update metadata
             if updated:
-                core_data["metadata"]["last_updated"] = datetime.now().isoformat()
+                core_data["metadata"]["last_updated"] = self._run_timestamp
                 core_data["metadata"]["version"] = self._increment_version(core_data["metadata"].get("version", "1.0"))
 
                 # Save updated core principles
-                with open(core_principles_path, "w", encoding="utf-8") as f:
-                    json.dump(core_data, f, indent=2, ensure_ascii=False)
+                write_json_atomic(self.core_principles_path, core_data)
 
-                if self.verbose:
-                    print("✅ Core principles updated successfully")
+                self._log("✅ Core principles updated successfully")
                 return True
             else:
-                if self.verbose:
-                    print("ℹ️  No updates needed")
+                self._log("ℹ️  No updates needed")
                 return True
 
         except Exception as e:
             self.errors.append(f"Error updating core principles: {e}")
-            if self.verbose:
-                print(f"❌ Error updating core principles: {e}")
+            self._log(f"❌ Error updating core principles: {e}")
             return False
 
     def _get_core_section_name(self, category: str) -> str | None:
         """Get the appropriate section name in core principles for a category."""
-        section_mapping = {
-            "documentation_patterns": "documentation_patterns",
-            "code_organization": "code_organization_patterns",
-            "code_quality": "code_quality_patterns",
-            "error_handling": "error_handling_patterns",
-            "file_operations": "file_operations_patterns",
-            "logging_patterns": "logging_patterns",
-            "database_patterns": "database_patterns",
-            "api_patterns": "api_patterns",
-            "testing_patterns": "testing_patterns",
-            "security_patterns": "security_patterns",
-        }
-
-        return section_mapping.get(category)
+        return SECTION_MAPPING.get(category)
 
     def _format_section_title(self, category: str) -> str:
         """Format a category name into a proper section title."""
@@ -445,28 +632,71 @@ class DynamicIntegration:
             return str(pattern_data)
 
     def _increment_version(self, version: str) -> str:
-        """Increment version number."""
-        min_version_parts = 2
-        try:
-            parts = version.split(".")
-            if len(parts) >= min_version_parts:
-                major, minor = parts[0], parts[1]
-                new_minor_int = int(minor) + 1
-                new_minor_str: str = str(new_minor_int)
-                result: str = f"{major}.{new_minor_str}"
-                return result
-        except (ValueError, IndexError):
-            pass
+        """Increment the minor part of a ``major.minor`` version number."""
+        match = VERSION_PATTERN.match(version)
+        if match:
+            return f"{match[1]}.{int(match[2]) + 1}"
         return "1.1"
 
     def _generate_integration_report(self, trigger: str) -> None:
-        """Generate a comprehensive integration report."""
-        if self.verbose:
-            print("📊 Generating integration report...")
+        """Generate a comprehensive integration report.
+
+        A run that changed nothing keeps the previous completed report and only
+        refreshes its modification time, which still records that the current
+        inputs have been integrated. Otherwise the report is replaced atomically.
+        """
+        self._log("📊 Generating integration report...")
+
+        if not (self.changes_made or self.conflicts_resolved or self.errors) and self._refresh_completed_report():
+            self._log(f"ℹ️  Nothing changed, kept integration report: {self.report_path}")
+        else:
+            self._write_integration_report(trigger)
+
+        # Print summary
+        self._log("\n📊 Integration Summary:")
+        self._log(f"   Changes made: {len(self.changes_made)}")
+        self._log(f"   Conflicts resolved: {len(self.conflicts_resolved)}")
+        self._log(f"   Errors: {len(self.errors)}")
+
+    @staticmethod
+    def _is_completed_report(report: Any) -> bool:
+        """Check whether a loaded integration report recorded a completed run.
+
+        Args:
+            report: Parsed contents of a previous report, of any JSON shape.
+
+        Returns:
+            True if the report is an object whose metadata status is completed.
+        """
+        if not isinstance(report, dict):
+            return False
+        metadata = report.get("metadata")
+        return isinstance(metadata, dict) and metadata.get("status") == "completed"
 
+    def _refresh_completed_report(self) -> bool:
+        """Mark the previous report as current if it recorded a completed run.
+
+        Returns:
+            True if a completed report exists and was refreshed, False otherwise.
+        """
+        try:
+            previous_report = _load_json(self.report_path)
+            if not self._is_completed_report(previous_report):
+                return False
+            os.utime(self.report_path)
+        except (OSError, ValueError):
+            return False
+        return True
+
+    def _write_integration_report(self, trigger: str) -> None:
+        """Write the integration report for this run.
+
+        Args:
+            trigger: The trigger that initiated the integration.
+        """
         report = {
             "metadata": {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": self._run_timestamp,
                 "trigger": trigger,
                 "status": "completed" if not self.errors else "failed",
             },
@@ -478,23 +708,10 @@ class DynamicIntegration:
             "details": {"changes": self.changes_made, "conflicts": self.conflicts_resolved, "errors": self.errors},
         }
 
-        # Save report
-        output_dir = os.path.join(self.ai_folder, "outputs", "dynamic_integration")
-        os.makedirs(output_dir, exist_ok=True)
+        os.makedirs(self.output_dir, exist_ok=True)
+        write_json_atomic(self.report_path, report)
 
-        report_path = os.path.join(output_dir, "integration-report.json")
-        with open(report_path, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2, ensure_ascii=False)
-
-        if self.verbose:
-            print(f"📄 Integration report saved to: {report_path}")
-
-        # Print summary
-        if self.verbose:
-            print("\n📊 Integration Summary:")
-            print(f"   Changes made: {len(self.changes_made)}")
-            print(f"   Conflicts resolved: {len(self.conflicts_resolved)}")
-            print(f"   Errors: {len(self.errors)}")
+        self._log(f"📄 Integration report saved to: {self.report_path}")
 
 
 def main() -> None:
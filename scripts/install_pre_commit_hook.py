@@ -6,10 +6,11 @@ This script installs the pre-commit hook that automatically triggers dynamic int
 when AI documentation guides are modified.
 """
 
-import shutil
-import stat
+import os
 from pathlib import Path
 
+HOOK_MODE = 0o755
+
 
 def install_pre_commit_hook() -> bool:
     """Install the pre-commit hook."""
@@ -35,12 +36,16 @@ def install_pre_commit_hook() -> bool:
         print(f"❌ Pre-commit hook script not found: {hook_script}")
         return False
 
-    try:
-        # Copy the script
-        shutil.copy2(hook_script, pre_commit_hook)
+    # Staged next to the hook so a failed install leaves any previous hook in place
+    temp_hook = pre_commit_hook.with_name(f"{pre_commit_hook.name}.tmp")
 
-        # Make it executable
-        pre_commit_hook.chmod(pre_commit_hook.stat().st_mode | stat.S_IEXEC)
+    try:
+        # Write an executable copy of the script in one go, then swap it in
+        temp_hook.unlink(missing_ok=True)
+        fd = os.open(temp_hook, os.O_WRONLY | os.O_CREAT | os.O_EXCL, HOOK_MODE)
+        with os.fdopen(fd, "wb") as f:
+            f.write(hook_script.read_bytes())
+        os.replace(temp_hook, pre_commit_hook)
 
         print(f"✅ Pre-commit hook installed: {pre_commit_hook}")
         print()
@@ -56,6 +61,7 @@ def install_pre_commit_hook() -> bool:
         return True
 
     except Exception as e:
+        temp_hook.unlink(missing_ok=True)
         print(f"❌ Error installing pre-commit hook: {e}")
         return False
 
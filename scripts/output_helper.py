@@ -4,6 +4,10 @@
 This module provides a helper class for generating proper JSON output for AI tooling.
 All helper scripts should use this class to ensure consistent, AI-friendly output.
 
+It also holds the JSON codec and atomic file writer shared by the helper scripts.
+The codec uses orjson when it is installed and the standard library otherwise;
+both produce the same two-space indented UTF-8 output.
+
 References:
     - [Python Style Guide](humans/guides/python_style_guide.md)
     - [AI Documentation Rules](ai/ai_rules.json)
@@ -15,11 +19,39 @@ SPDX-License-Identifier: [MIT](https://spdx.org/licenses/MIT.html)
 """
 
 # Standard library imports
+import contextlib
 import json
 import os
+import stat
+import tempfile
 from datetime import datetime
 from typing import Any, TypedDict
 
+# Third-party imports
+try:
+    import orjson
+
+    def json_loads(data: bytes) -> Any:
+        """Parse JSON from bytes."""
+        return orjson.loads(data)
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize an object to indented UTF-8 JSON bytes."""
+        # Annotated so type checking passes whether or not orjson is installed
+        payload: bytes = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+        return payload
+
+except ImportError:  # orjson is optional; fall back to the stdlib codec
+
+    def json_loads(data: bytes) -> Any:
+        """Parse JSON from bytes."""
+        return json.loads(data)
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize an object to indented UTF-8 JSON bytes."""
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 # Local imports
 # (None for this module)
 
@@ -30,6 +62,39 @@ DEFAULT_SUCCESS = True
 # (None for this module)
 
 
+def write_json_atomic(path: str, data: Any) -> None:
+    """Write JSON to a file atomically.
+
+    The data is written and synced to a temporary file in the same folder, which
+    then replaces the target in one step. Readers therefore see either the old
+    file or the complete new one, never a partial write. The target keeps its
+    permissions; a new file gets the usual umask-based mode.
+
+    Args:
+        path: Path to the JSON file.
+        data: The data to serialize.
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(json_dumps(data))
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(temp_path)
+        raise
+
+
 class ResultsDict(TypedDict):
     success: bool
     data: dict[str, Any]
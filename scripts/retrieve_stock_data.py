@@ -1,86 +1,131 @@
 #!/usr/bin/env python3
 """Command-line interface for retrieving stock data from Yahoo Finance."""
 
-import asyncio
-import json
 import os
-from datetime import datetime
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
 
 import click
+from output_helper import write_json_atomic
 from stargazer_utils.logging import get_logger_for
 
-from cream_api.stock_data.config import get_stock_data_config
-from cream_api.stock_data.retriever import StockDataRetriever
+# The retriever stack (asyncio, aiohttp, FastAPI) is imported only when data is
+# actually retrieved, so --help and argument errors return without loading it.
+if TYPE_CHECKING:
+    from cream_api.stock_data.retriever import StockDataRetriever
 
 logger = get_logger_for(__name__)
 
+# Symbols retrieved at once in a batch; keeps a long symbol list under Yahoo's rate limit
+MAX_CONCURRENT_RETRIEVALS = 8
 
-def generate_ai_report(symbol: str, end_date: str | None, success: bool, error_message: str | None) -> None:
+# Project root and AI output directory, resolved once at import
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_AI_OUTPUT_DIR = os.path.join(_PROJECT_ROOT, "ai", "outputs", "stock_data_operations")
+
+
+def generate_ai_report(symbols: Sequence[str], end_date: str | None, success: bool, error_message: str | None) -> None:
     """Generate AI report for stock data retrieval."""
-    # Get project root and AI output directory
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(script_dir)
-    ai_output_dir = os.path.join(project_root, "ai", "outputs", "stock_data_operations")
+    from datetime import datetime
 
     # Ensure output directory exists
-    os.makedirs(ai_output_dir, exist_ok=True)
+    os.makedirs(_AI_OUTPUT_DIR, exist_ok=True)
 
-    # Generate report
+    # Generate report; single-symbol runs keep the original "symbol" field, batches list every symbol
     timestamp = datetime.now().isoformat()
+    symbol_field = {"symbol": symbols[0]} if len(symbols) == 1 else {"symbols": list(symbols)}
     report = {
         "metadata": {
             "title": "Stock Data Retrieval Results",
             "description": "Results from stock data retrieval operation",
-            "version": "1.0.0",
+            "version": "1.1.0",
             "last_updated": timestamp,
             "source": "scripts/retrieve_stock_data.py",
             "cross_references": ["cream_api/stock_data/", "pyproject.toml"],
         },
         "stock_data_retrieval": {
             "success": success,
-            "symbol": symbol,
+            **symbol_field,
             "end_date": end_date,
             "timestamp": timestamp,
             "error_message": error_message,
         },
         "environment": {
             "python_version": "3.x",
-            "working_directory": project_root,
-            "project_root": project_root,
+            "working_directory": _PROJECT_ROOT,
+            "project_root": _PROJECT_ROOT,
         },
     }
 
-    # Save report
-    report_file = os.path.join(ai_output_dir, "stock-data-retrieval-results.json")
-    with open(report_file, "w", encoding="utf-8") as file:
-        json.dump(report, file, indent=2, ensure_ascii=False)
+    # Save report atomically so readers never see a partial write
+    report_file = os.path.join(_AI_OUTPUT_DIR, "stock-data-retrieval-results.json")
+    write_json_atomic(report_file, report)
 
     click.echo(f"📄 AI report saved to: {report_file}")
 
 
+async def _retrieve_all(
+    retriever: "StockDataRetriever", symbols: Sequence[str], end_date: str | None
+) -> list[BaseException | None]:
+    """Retrieve every symbol concurrently over one shared HTTP session.
+
+    At most ``MAX_CONCURRENT_RETRIEVALS`` requests are in flight at a time.
+
+    Returns:
+        One entry per symbol, in order: None on success or the exception raised for it.
+    """
+    import asyncio
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_RETRIEVALS)
+
+    async with retriever.create_session() as session:
+
+        async def retrieve(symbol: str) -> None:
+            async with semaphore:
+                await retriever.get_historical_data(symbol, end_date, session=session)
+
+        return await asyncio.gather(*(retrieve(symbol) for symbol in symbols), return_exceptions=True)
+
+
 @click.command()
-@click.argument("symbol", type=str)
+@click.argument("symbols", nargs=-1, required=True, type=str)
 @click.option("--end-date", type=str, help="End date in YYYY-MM-DD format (defaults to today)", default=None)
-def retrieve_stock_data(symbol: str, end_date: str | None) -> None:
-    """Retrieve historical stock data for a given symbol from Yahoo Finance.
+def retrieve_stock_data(symbols: tuple[str, ...], end_date: str | None) -> None:
+    """Retrieve historical stock data for one or more symbols from Yahoo Finance.
 
-    SYMBOL: The stock symbol to fetch data for (e.g., AAPL, MSFT)
+    SYMBOLS: The stock symbols to fetch data for (e.g., AAPL MSFT)
     """
+    import asyncio
+
+    from cream_api.stock_data.config import get_stock_data_config
+    from cream_api.stock_data.retriever import StockDataRetriever
+
     try:
         config = get_stock_data_config()
         retriever = StockDataRetriever(config=config)
-        asyncio.run(retriever.get_historical_data(symbol, end_date))
-        click.echo(f"Successfully retrieved data for {symbol}")
+        results = asyncio.run(_retrieve_all(retriever, symbols, end_date))
+
+        errors = []
+        for symbol, result in zip(symbols, results, strict=True):
+            if result is None:
+                click.echo(f"Successfully retrieved data for {symbol}")
+            elif isinstance(result, Exception):
+                errors.append(f"{symbol}: {result}" if len(symbols) > 1 else str(result))
+            else:
+                raise result
+
+        if errors:
+            raise click.ClickException("; ".join(errors))
 
         # Generate AI report for success
-        generate_ai_report(symbol, end_date, True, None)
+        generate_ai_report(symbols, end_date, True, None)
 
     except Exception as e:
-        error_message = str(e)
+        error_message = e.message if isinstance(e, click.ClickException) else str(e)
         logger.error("Failed to retrieve stock data: %s", error_message)
 
         # Generate AI report for failure
-        generate_ai_report(symbol, end_date, False, error_message)
+        generate_ai_report(symbols, end_date, False, error_message)
 
         raise click.ClickException(error_message) from e
 
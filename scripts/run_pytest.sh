@@ -15,6 +15,8 @@ TEST_PATH=""
 TEST_FUNCTION=""
 MARKER=""
 WATCH_MODE=false
+TEST_FILE_PATTERN="test_*.py"  # Project naming convention for test files (pytest also collects *_test.py)
+PYTEST_ARGS=()
 
 # Function to show usage information
 show_usage() {
@@ -60,12 +62,8 @@ list_test_files() {
     print_status "Available pytest test files:"
     echo
 
-    # Find all test files recursively
-    find cream_api/tests -name "test_*.py" -type f | while read -r file; do
-        # Get relative path from project root
-        rel_path="${file#cream_api/}"
-        echo "  $rel_path"
-    done
+    # Find all test files recursively, printed relative to cream_api in one sed pass
+    find cream_api/tests -name "$TEST_FILE_PATTERN" -type f | sed 's|^cream_api/|  |'
     echo
 }
 
@@ -81,10 +79,8 @@ list_test_functions() {
     print_status "Pytest test functions in $file:"
     echo
 
-    # Extract test function names using grep
-    grep -E "^def test_" "$file" | sed 's/def //' | sed 's/(.*$//' | while read -r func; do
-        echo "  $func"
-    done
+    # Extract test function names in a single sed pass
+    sed -nE 's/^def (test_[A-Za-z0-9_]*).*$/  \1/p' "$file"
     echo
 }
 
@@ -110,7 +106,8 @@ validate_test_path() {
 
     # Check if it's a file
     if [[ -f "$path" ]]; then
-        if [[ "$path" == *test_*.py ]]; then
+        # Match the file name alone against the glob, without spawning basename
+        if [[ "${path##*/}" == $TEST_FILE_PATTERN ]]; then
             return 0
         else
             print_error "File $path is not a pytest test file (should start with 'test_')"
@@ -120,8 +117,8 @@ validate_test_path() {
 
     # Check if it's a directory
     if [[ -d "$path" ]]; then
-        # Check if directory contains test files
-        if find "$path" -name "test_*.py" -type f | grep -q .; then
+        # Check if directory contains test files, stopping the search at the first match
+        if [[ -n "$(find "$path" -name "$TEST_FILE_PATTERN" -type f -print -quit)" ]]; then
             return 0
         else
             print_error "Directory $path contains no pytest test files"
@@ -133,6 +130,30 @@ validate_test_path() {
     return 1
 }
 
+# Function to build the pytest arguments from the parsed options into PYTEST_ARGS
+build_pytest_args() {
+    PYTEST_ARGS=()
+
+    # Add verbose flag if requested
+    if [ "$VERBOSE" = true ]; then
+        PYTEST_ARGS+=("-v")
+    fi
+
+    # Add marker if specified
+    if [[ -n "$MARKER" ]]; then
+        PYTEST_ARGS+=("-m" "$MARKER")
+    fi
+
+    # Add test path and function if specified
+    if [[ -n "$TEST_PATH" ]]; then
+        if [[ -n "$TEST_FUNCTION" ]]; then
+            PYTEST_ARGS+=("$TEST_PATH::$TEST_FUNCTION")
+        else
+            PYTEST_ARGS+=("$TEST_PATH")
+        fi
+    fi
+}
+
 # Function to run tests in watch mode
 run_watch_mode() {
     print_status "Starting pytest watch mode - tests will re-run when files change"
@@ -165,30 +186,8 @@ run_watch_mode() {
 run_tests_once() {
     local start_time=$(date +%s)
 
-    # Build pytest arguments
-    local pytest_args=()
-
-    # Add verbose flag if requested
-    if [ "$VERBOSE" = true ]; then
-        pytest_args+=("-v")
-    fi
-
-    # Add marker if specified
-    if [[ -n "$MARKER" ]]; then
-        pytest_args+=("-m" "$MARKER")
-    fi
-
-    # Add test path and function if specified
-    if [[ -n "$TEST_PATH" ]]; then
-        if [[ -n "$TEST_FUNCTION" ]]; then
-            pytest_args+=("$TEST_PATH::$TEST_FUNCTION")
-        else
-            pytest_args+=("$TEST_PATH")
-        fi
-    fi
-
-    # Run pytest
-    if poetry run coverage run -m pytest "${pytest_args[@]}"; then
+    # Run pytest with the arguments built once at startup
+    if poetry run coverage run -m pytest "${PYTEST_ARGS[@]}"; then
         local end_time=$(date +%s)
         local duration=$((end_time - start_time))
         print_success "Pytest completed successfully in ${duration}s"
@@ -302,6 +301,9 @@ if [ "$WATCH_MODE" = true ]; then
     print_status "Watch mode: Enabled"
 fi
 
+# Build pytest arguments once; they are the same for every run, including watch mode reruns
+build_pytest_args
+
 # Handle watch mode
 if [ "$WATCH_MODE" = true ]; then
     run_watch_mode
@@ -311,36 +313,21 @@ fi
 # Handle regular pytest execution
 start_time=$(date +%s)
 
-# Build pytest arguments
-PYTEST_ARGS=()
-
-# Add verbose flag if requested
-if [ "$VERBOSE" = true ]; then
-    PYTEST_ARGS+=("-v")
-fi
-
-# Add marker if specified
-if [[ -n "$MARKER" ]]; then
-    PYTEST_ARGS+=("-m" "$MARKER")
-fi
-
-# Add test path and function if specified
-if [[ -n "$TEST_PATH" ]]; then
-    if [[ -n "$TEST_FUNCTION" ]]; then
-        PYTEST_ARGS+=("$TEST_PATH::$TEST_FUNCTION")
-    else
-        PYTEST_ARGS+=("$TEST_PATH")
-    fi
-fi
-
 # Change to cream_api directory and run pytest
 pushd cream_api > /dev/null
 
-# Create temporary file for pytest output
-TEMP_OUTPUT_FILE=$(mktemp)
+# Test output goes to a separate file for the AI report to avoid escaping issues
+mkdir -p "$AI_OUTPUT_DIR"
+TEST_OUTPUT_FILE="$AI_OUTPUT_DIR/pytest_output.txt"
+
+# Capture into a sibling temp file that replaces the previous output only once pytest exits,
+# so the last report never points at a truncated or partial file
+TEMP_OUTPUT_FILE="$TEST_OUTPUT_FILE.$$.tmp"
+trap 'rm -f "$TEMP_OUTPUT_FILE"' EXIT
 
 # Run pytest with live output and capture to file
 if poetry run coverage run -m pytest "${PYTEST_ARGS[@]}" 2>&1 | tee "$TEMP_OUTPUT_FILE"; then
+    mv -f "$TEMP_OUTPUT_FILE" "$TEST_OUTPUT_FILE"
     end_time=$(date +%s)
     duration=$((end_time - start_time))
     print_success "Pytest completed successfully in ${duration}s"
@@ -351,33 +338,22 @@ if poetry run coverage run -m pytest "${PYTEST_ARGS[@]}" 2>&1 | tee "$TEMP_OUTPU
     poetry run coverage report --show-missing > "$COVERAGE_OUTPUT_FILE" 2>&1
     print_success "Coverage report generated: $COVERAGE_OUTPUT_FILE"
 
-    # Capture test output for AI report - write to separate file to avoid escaping issues
-    TEST_OUTPUT_FILE="$AI_OUTPUT_DIR/pytest_output.txt"
-    cat "$TEMP_OUTPUT_FILE" > "$TEST_OUTPUT_FILE"
     ADDITIONAL_CONTENT="  \"test_details\": {\n    \"test_path\": \"${TEST_PATH:-"All tests"}\",\n    \"test_function\": \"${TEST_FUNCTION:-"All functions"}\",\n    \"marker\": \"${MARKER:-"None"}\",\n    \"verbose\": \"$VERBOSE\",\n    \"watch_mode\": \"$WATCH_MODE\"\n  },\n  \"test_output_file\": \"$(basename "$TEST_OUTPUT_FILE")\",\n  \"coverage_report_file\": \"$(basename "$COVERAGE_OUTPUT_FILE")\","
 
     generate_ai_report "pytest" "success" "$duration" "$AI_OUTPUT_DIR" "$ADDITIONAL_CONTENT"
 
-    # Clean up temp file
-    rm -f "$TEMP_OUTPUT_FILE"
-
     popd > /dev/null
     exit 0
 else
+    mv -f "$TEMP_OUTPUT_FILE" "$TEST_OUTPUT_FILE"
     end_time=$(date +%s)
     duration=$((end_time - start_time))
     print_error "Pytest failed after ${duration}s"
 
-    # Capture test output for AI report - write to separate file to avoid escaping issues
-    TEST_OUTPUT_FILE="$AI_OUTPUT_DIR/pytest_output.txt"
-    cat "$TEMP_OUTPUT_FILE" > "$TEST_OUTPUT_FILE"
     ADDITIONAL_CONTENT="  \"test_details\": {\n    \"test_path\": \"${TEST_PATH:-"All tests"}\",\n    \"test_function\": \"${TEST_FUNCTION:-"All functions"}\",\n    \"marker\": \"${MARKER:-"None"}\",\n    \"verbose\": \"$VERBOSE\",\n    \"watch_mode\": \"$WATCH_MODE\"\n  },\n  \"test_output_file\": \"$(basename "$TEST_OUTPUT_FILE")\","
 
     generate_ai_report "pytest" "failed" "$duration" "$AI_OUTPUT_DIR" "$ADDITIONAL_CONTENT"
 
-    # Clean up temp file
-    rm -f "$TEMP_OUTPUT_FILE"
-
     popd > /dev/null
     exit 1
 fi